@@ -7,7 +7,10 @@ Esta versión se basa en la v2 (navegación por pestañas) y añade
 funcionalidades avanzadas de análisis, exportación y gestión.
 
 1.  Manejo de Estado (st.session_state):
-    Se mantiene como pilar, sin cambios en la estructura.
+    Se mantiene como pilar. Los estudiantes se guardan como arreglos
+    paralelos: `names` (lista de nombres) y `notes` (np.ndarray int16
+    en punto fijo, centésimas de punto; preasignado y crece al doble,
+    solo las primeras `len(names)` posiciones son válidas).
 
 2.  Navegación en Página (st.tabs):
     Se renombra la pestaña "Mostrar Notas" a "Reporte General" y
@@ -29,6 +32,9 @@ funcionalidades avanzadas de análisis, exportación y gestión.
       todos los datos de la sesión con confirmación.
 """
 
+import math
+from collections import Counter, defaultdict
+
 import streamlit as st
 import pandas as pd
 import numpy as np # Necesario para algunas estadísticas
@@ -42,10 +48,21 @@ st.set_page_config(
 
 # --- Constantes del Programa ---
 MODIFICATION_LIMIT = 3
+# Mensajes del límite de modificaciones, precalculados una sola vez
+LIMIT_REACHED_MSG = f"Se ha alcanzado el límite de {MODIFICATION_LIMIT} modificaciones"
+# REMAINING_MSG[k]: intentos que quedan tras la modificación número k + 1
+REMAINING_MSG = tuple(
+    f"Intentos restantes: {MODIFICATION_LIMIT - used}"
+    for used in range(1, MODIFICATION_LIMIT + 1)
+)
 PASSING_GRADE = 3.0 # Nota mínima para aprobar (escala 1-5)
+GRADE_SCALE = 100 # Las notas se guardan como enteros en centésimas (3.25 -> 325)
+NOTES_INITIAL_CAPACITY = 16 # Capacidad inicial del arreglo de notas
+PAGE_SIZE = 50 # Filas por página en el listado de estudiantes
+CACHE_MAX_ENTRIES = 32 # Entradas máximas por caché de st.cache_data (compartida entre sesiones)
 
 # --- CSS Personalizado (v2) ---
-st.markdown("""
+CUSTOM_CSS = """
 <style>
 /* Estilo para el título principal */
 h1 {
@@ -91,76 +108,236 @@ button[kind...].st-emotion-cache-s49nzw:hover {
     background-color: #B91C1C;
 }
 </style>
-""", unsafe_allow_html=True)
+"""
+
+@st.cache_resource(show_spinner=False)
+def inject_css():
+    """
+    Inyecta el CSS personalizado. Al estar en caché, el bloque no se
+    vuelve a ejecutar en cada rerun: Streamlit reproduce el elemento.
+    """
+    st.markdown(CUSTOM_CSS, unsafe_allow_html=True)
+
+inject_css()
 
 
 # --- Inicialización del Estado de la Sesión ---
-if 'students' not in st.session_state:
-    st.session_state.students = []
+# Estructura de arreglos: `ids[i]`, `names[i]` y `notes[i]` describen al estudiante i
+if 'ids' not in st.session_state:
+    st.session_state.ids = []
+if 'next_id' not in st.session_state:
+    # Identificador entero que se asigna al siguiente estudiante agregado
+    st.session_state.next_id = 0
+if 'names' not in st.session_state:
+    st.session_state.names = []
+if 'notes' not in st.session_state:
+    st.session_state.notes = np.empty(NOTES_INITIAL_CAPACITY, dtype=np.int16)
 if 'modification_attempts' not in st.session_state:
-    st.session_state.modification_attempts = {}
+    # id del estudiante -> cantidad de modificaciones realizadas
+    st.session_state.modification_attempts = defaultdict(int)
+if 'name_to_index' not in st.session_state:
+    # Índice paralelo: nombre en minúsculas -> posición en `names`/`notes`
+    st.session_state.name_to_index = {}
+if 'students_version' not in st.session_state:
+    # Se incrementa en cada cambio de datos; sirve como llave de caché
+    st.session_state.students_version = 0
+if 'note_hist' not in st.session_state:
+    # Histograma incremental: nota (punto fijo) -> cantidad de estudiantes
+    st.session_state.note_hist = Counter()
+if 'grade_total' not in st.session_state:
+    # Suma acumulada (exacta, en punto fijo) de las notas, para el promedio en O(1)
+    st.session_state.grade_total = 0
 
 # --- Lógica de Negocio (Controladores) ---
 
 def find_student_index(name):
     """Encuentra el índice de un estudiante. Retorna el índice o None."""
-    for i, student in enumerate(st.session_state.students):
-        if student['nombre'].lower() == name.lower():
-            return i
-    return None
+    return st.session_state.name_to_index.get(name.lower())
+
+def to_fixed(grade):
+    """Convierte una nota (float) a punto fijo en centésimas."""
+    return int(round(grade * GRADE_SCALE))
+
+def from_fixed(note):
+    """Convierte una nota en punto fijo de vuelta a float."""
+    return int(note) / GRADE_SCALE
+
+def get_notes():
+    """Retorna una vista de las notas válidas (sin la capacidad sobrante)."""
+    return st.session_state.notes[:len(st.session_state.names)]
 
 def get_stats():
     """
     Calcula todas las estadísticas: promedio, alta y baja.
     Retorna un diccionario con las estadísticas.
+    Usa la suma acumulada y el histograma, sin recorrer las notas.
     """
-    if not st.session_state.students:
+    n = len(st.session_state.names)
+    if n == 0:
         return {"average": 0.0, "high": 0.0, "low": 0.0}
 
-    try:
-        notes = [student['nota'] for student in st.session_state.students]
-        average = np.mean(notes)
-        high = np.max(notes)
-        low = np.min(notes)
-        return {"average": average, "high": high, "low": low}
-    except Exception:
-        return {"average": 0.0, "high": 0.0, "low": 0.0}
+    hist = st.session_state.note_hist
+    return {
+        "average": st.session_state.grade_total / n / GRADE_SCALE,
+        "high": from_fixed(max(hist)),
+        "low": from_fixed(min(hist)),
+    }
+
+def get_note_counts():
+    """Retorna la cantidad de estudiantes por nota, ordenada por nota."""
+    hist = st.session_state.note_hist
+    note_counts = pd.Series(
+        list(hist.values()),
+        index=np.fromiter(hist.keys(), dtype=np.int16, count=len(hist)) / GRADE_SCALE,
+        name="count",
+    )
+    return note_counts.sort_index()
+
+def _count_note(note):
+    """Suma una nota (punto fijo) al histograma y a la suma acumulada."""
+    note = int(note)
+    st.session_state.note_hist[note] += 1
+    st.session_state.grade_total += note
+
+def _discount_note(note):
+    """Resta una nota (punto fijo) del histograma y de la suma acumulada."""
+    note = int(note)
+    hist = st.session_state.note_hist
+    hist[note] -= 1
+    if hist[note] <= 0:
+        del hist[note]
+    st.session_state.grade_total -= note
+
+def add_student(name, grade):
+    """Agrega un estudiante al final de `names`/`notes`."""
+    note = to_fixed(grade)
+    size = len(st.session_state.names)
+    if size == st.session_state.notes.size:
+        # Crecimiento al doble: inserción en O(1) amortizado
+        grown = np.empty(max(2 * size, NOTES_INITIAL_CAPACITY), dtype=np.int16)
+        grown[:size] = st.session_state.notes
+        st.session_state.notes = grown
+    st.session_state.notes[size] = note
+    st.session_state.ids.append(st.session_state.next_id)
+    st.session_state.next_id += 1
+    st.session_state.names.append(name)
+    st.session_state.name_to_index[name.lower()] = len(st.session_state.names) - 1
+    _count_note(note)
+    st.session_state.students_version += 1
+
+def add_students(rows):
+    """
+    Agrega varios estudiantes en una sola operación.
+    `rows` es un iterable de pares (nombre, nota). Retorna la cantidad
+    agregada y la lista de filas omitidas (nombre vacío, nota fuera de
+    rango o nombre repetido).
+    """
+    added = 0
+    skipped = []
+    for name, grade in rows:
+        if not isinstance(name, str) or not name:
+            skipped.append("(sin nombre)")
+        elif pd.isna(grade) or not 1.0 <= grade <= 5.0:
+            skipped.append(name)
+        elif name.lower() in st.session_state.name_to_index:
+            skipped.append(name)
+        else:
+            add_student(name, grade)
+            added += 1
+    return added, skipped
+
+def with_skipped_summary(message, skipped):
+    """
+    Agrega a `message` la lista de filas omitidas por `add_students`.
+    Si no se omitió ninguna fila, retorna `message` sin cambios.
+    """
+    if not skipped:
+        return message
+    return (
+        f"{message} Filas omitidas (nombre vacío, nota inválida o estudiante existente): "
+        + ", ".join(skipped)
+    )
+
+def update_student_grade(index, new_grade):
+    """Reemplaza la nota del estudiante en `index`."""
+    note = to_fixed(new_grade)
+    _discount_note(st.session_state.notes[index])
+    st.session_state.notes[index] = note
+    _count_note(note)
+    st.session_state.students_version += 1
 
 def delete_student(name):
     """Elimina un estudiante de la lista y sus intentos."""
-    index_to_delete = find_student_index(name)
+    index_to_delete = st.session_state.name_to_index.pop(name.lower(), None)
     if index_to_delete is not None:
-        st.session_state.students.pop(index_to_delete)
+        ids = st.session_state.ids
+        names = st.session_state.names
+        notes = st.session_state.notes
+        student_id = ids[index_to_delete]
+        _discount_note(notes[index_to_delete])
+        # Intercambiar con el último y recortar: O(1), no conserva el orden
+        last = len(names) - 1
+        if index_to_delete != last:
+            ids[index_to_delete] = ids[last]
+            names[index_to_delete] = names[last]
+            notes[index_to_delete] = notes[last]
+            st.session_state.name_to_index[names[index_to_delete].lower()] = index_to_delete
+        ids.pop()
+        names.pop()
+        st.session_state.students_version += 1
         # Limpiar también el contador de intentos
-        if name in st.session_state.modification_attempts:
-            del st.session_state.modification_attempts[name]
+        st.session_state.modification_attempts.pop(student_id, None)
         return True
     return False
 
 def reset_all_data():
     """Elimina todos los datos de la sesión."""
-    st.session_state.students = []
-    st.session_state.modification_attempts = {}
+    st.session_state.ids = []
+    st.session_state.names = []
+    st.session_state.notes = np.empty(NOTES_INITIAL_CAPACITY, dtype=np.int16)
+    st.session_state.modification_attempts = defaultdict(int)
+    st.session_state.name_to_index = {}
+    st.session_state.note_hist = Counter()
+    st.session_state.grade_total = 0
+    st.session_state.students_version += 1
+
+@st.cache_data(show_spinner=False, max_entries=CACHE_MAX_ENTRIES)
+def build_report(names, notes, version):
+    """
+    Construye el DataFrame del reporte (con 'Estado').
+    Se recalcula solo cuando cambian los datos (`version`).
+    """
+    # Centésimas -> float64: 310 / 100 da exactamente el float más cercano a 3.1
+    df = pd.DataFrame({'nombre': names, 'nota': notes / GRADE_SCALE})
+    # Estado como categoría: un código int8 por fila en lugar de un str
+    passed = (notes >= to_fixed(PASSING_GRADE)).astype(np.int8)
+    df['Estado'] = pd.Categorical.from_codes(passed, categories=["Reprobado", "Aprobado"])
+    # Nombres en minúsculas precalculados para la búsqueda (columna auxiliar)
+    df['_nombre_lower'] = df['nombre'].str.lower()
+    return df
+
+@st.cache_data(show_spinner=False, max_entries=CACHE_MAX_ENTRIES)
+def build_csv(names, notes, version):
+    """Serializa el reporte a CSV (bytes UTF-8), en caché por `version`."""
+    df = build_report(names, notes, version).drop(columns='_nombre_lower')
+    return df.to_csv(index=False, float_format='%.2f').encode('utf-8')
 
 
 # --- UI Principal ---
 st.title("🎓 Sistema de Gestión de Notas")
 st.write("Bienvenido al sistema. Navegue usando las pestañas a continuación.")
 
-# --- Navegación por Pestañas (En lugar del Sidebar) ---
-tab_display, tab_add, tab_modify, tab_admin = st.tabs([
-    "📊 Reporte General",
-    "➕ Ingresar Nota",
-    "✏️ Modificar Nota",
-    "🗑️ Administración"
-])
-
 
 # --- Pestaña 1: Reporte General (Actividad 3 Mejorada) ---
-with tab_display:
+@st.fragment
+def render_report():
+    """
+    Dibuja el reporte general. Al ser un fragmento, las interacciones
+    dentro de él (p. ej. el buscador) solo re-ejecutan esta función.
+    """
     st.header("Actividad 3: Reporte General y Análisis")
     
-    if not st.session_state.students:
+    if not st.session_state.names:
         st.info("Aún no se han ingresado estudiantes. Agregue uno en la pestaña 'Ingresar Nota'.")
     else:
         # 1. Obtener estadísticas
@@ -178,32 +355,49 @@ with tab_display:
         # 3. Listado de Estudiantes (con búsqueda y estado)
         st.subheader("Listado de Estudiantes")
         
-        # 3.a. Creación del DataFrame
-        df = pd.DataFrame(st.session_state.students)
-        # 3.b. Añadir columna de Estado
-        df['Estado'] = df['nota'].apply(lambda nota: "Aprobado" if nota >= PASSING_GRADE else "Reprobado")
+        # 3.a. Creación del DataFrame con su columna de Estado (en caché)
+        df = build_report(
+            st.session_state.names,
+            get_notes(),
+            st.session_state.students_version
+        )
         
-        # 3.c. Implementar Búsqueda
+        # 3.b. Implementar Búsqueda
         search_term = st.text_input("Buscar Estudiante por nombre:", placeholder="Escriba un nombre para filtrar...")
         if search_term:
-            filtered_df = df[df['nombre'].str.contains(search_term, case=False, na=False)]
+            # Búsqueda literal sobre la columna ya en minúsculas
+            needle = search_term.lower()
+            filtered_df = df[df['_nombre_lower'].str.contains(needle, regex=False, na=False)]
         else:
             filtered_df = df
-            
+
+        # 3.c. Paginación: solo se envía al navegador la página visible
+        total_pages = max(1, math.ceil(len(filtered_df) / PAGE_SIZE))
+        page = 1
+        if total_pages > 1:
+            page = st.number_input("Página", min_value=1, max_value=total_pages, value=1, step=1)
+        start = (page - 1) * PAGE_SIZE
+        page_df = filtered_df.iloc[start:start + PAGE_SIZE].drop(columns='_nombre_lower')
+
         # 3.d. Mostrar la tabla
-        st.dataframe(filtered_df, use_container_width=True)
+        st.dataframe(page_df, use_container_width=True)
+        if total_pages > 1:
+            st.caption(f"Página {page} de {total_pages} ({len(filtered_df)} estudiantes)")
 
         # 4. Gráfico de Distribución
         st.subheader("Distribución de Notas")
-        # Contamos cuántos estudiantes hay por cada nota
-        note_counts = df['nota'].value_counts().sort_index()
-        st.bar_chart(note_counts)
+        # Conteo de estudiantes por nota (histograma incremental)
+        st.bar_chart(get_note_counts())
 
         st.divider()
         
         # 5. Exportar a CSV
         st.subheader("Exportar Datos")
-        csv = df.to_csv(index=False).encode('utf-8')
+        csv = build_csv(
+            st.session_state.names,
+            get_notes(),
+            st.session_state.students_version
+        )
         st.download_button(
             label="Descargar Reporte en CSV",
             data=csv,
@@ -213,7 +407,8 @@ with tab_display:
 
 
 # --- Pestaña 2: Ingresar Notas (Actividad 1) ---
-with tab_add:
+def render_add():
+    """Dibuja la pestaña para ingresar un nuevo estudiante."""
     st.header("Actividad 1: Ingresar Nueva Nota")
 
     # Usamos st.form para agrupar entradas
@@ -232,44 +427,86 @@ with tab_add:
         # Validación de entradas
         if not name:
             st.error("El nombre del estudiante no puede estar vacío.")
-        elif find_student_index(name) is not None:
+        elif name.lower() in st.session_state.name_to_index:
             st.warning(f"El estudiante '{name}' ya existe en el sistema.")
         else:
             # Lógica de negocio
-            new_student = {"nombre": name, "nota": grade}
-            st.session_state.students.append(new_student)
+            add_student(name, grade)
             st.toast(f"¡Estudiante '{name}' agregado con nota {grade}!", icon="🎉")
+            # Rerun completo: el reporte se dibuja antes que esta pestaña
+            st.rerun()
+
+    st.divider()
+
+    # Ingreso masivo: varias filas en un solo envío (un único rerun)
+    st.subheader("Ingreso Masivo")
+    st.write("Agregue varias filas a la tabla y envíelas juntas.")
+    with st.form(key="bulk_add_form", clear_on_submit=True):
+        bulk_df = st.data_editor(
+            pd.DataFrame({"nombre": pd.Series(dtype="object"), "nota": pd.Series(dtype="float")}),
+            num_rows="dynamic",
+            column_config={
+                "nombre": st.column_config.TextColumn("Nombre del Estudiante"),
+                "nota": st.column_config.NumberColumn(
+                    "Nota (1.0 - 5.0)",
+                    min_value=1.0,
+                    max_value=5.0,
+                    step=0.1
+                ),
+            },
+            hide_index=True,
+            use_container_width=True
+        )
+        bulk_submitted = st.form_submit_button("Agregar Estudiantes", type="primary")
+
+    if bulk_submitted:
+        added, skipped = add_students(bulk_df.itertuples(index=False, name=None))
+        if added:
+            # st.toast sobrevive al rerun, a diferencia de st.success/st.warning
+            st.toast(with_skipped_summary(f"Agregados {added} estudiantes.", skipped), icon="🎉")
+            st.rerun()
+        elif skipped:
+            st.warning(with_skipped_summary("No se agregó ningún estudiante.", skipped))
 
 
 # --- Pestaña 3: Modificar Notas (Actividad 2) ---
-with tab_modify:
+@st.fragment
+def render_modify():
+    """
+    Dibuja la pestaña de modificación. Como fragmento, cambiar el
+    estudiante seleccionado solo re-ejecuta esta función.
+    """
     st.header("Actividad 2: Modificar Nota")
 
-    if not st.session_state.students:
+    if not st.session_state.names:
         st.info("No hay estudiantes ingresados para modificar.")
     else:
-        student_names = [student['nombre'] for student in st.session_state.students]
-        selected_name = st.selectbox(
+        # Las opciones son índices: la selección ya trae la posición del
+        # estudiante, sin buscarlo de nuevo en cada rerun del formulario
+        names = st.session_state.names
+        current_index = st.selectbox(
             "Seleccione el estudiante a modificar:",
-            student_names,
+            range(len(names)),
+            format_func=lambda i: names[i],
             index=None,
             placeholder="Seleccionar estudiante..."
         )
 
-        if selected_name:
+        if current_index is not None:
+            selected_name = names[current_index]
+            student_id = st.session_state.ids[current_index]
             # Obtenemos el contador de intentos
-            attempts = st.session_state.modification_attempts.get(selected_name, 0)
+            attempts = st.session_state.modification_attempts[student_id]
             st.info(f"Intentos de modificación para '{selected_name}': {attempts} / {MODIFICATION_LIMIT}")
 
             if attempts >= MODIFICATION_LIMIT:
-                st.error(f"Se ha alcanzado el límite de {MODIFICATION_LIMIT} modificaciones para '{selected_name}'.")
+                st.error(f"{LIMIT_REACHED_MSG} para '{selected_name}'.")
             else:
-                current_index = find_student_index(selected_name)
-                current_grade = st.session_state.students[current_index]['nota']
+                current_grade = from_fixed(st.session_state.notes[current_index])
 
                 with st.form(key="modify_student_form"):
                     new_grade = st.number_input(
-                        f"Nueva nota para {selected_name} (actual: {current_grade})",
+                        f"Nueva nota para {selected_name} (actual: {current_grade:.2f})",
                         min_value=1.0,
                         max_value=5.0,
                         step=0.1,
@@ -278,26 +515,36 @@ with tab_modify:
                     modify_submitted = st.form_submit_button("Actualizar Nota", type="primary")
 
                 if modify_submitted:
-                    if new_grade == current_grade:
+                    # Se compara en punto fijo, la precisión en que se almacena la nota
+                    if to_fixed(new_grade) == st.session_state.notes[current_index]:
                         st.warning("La nueva nota es igual a la actual. No se hicieron cambios.")
                     else:
-                        st.session_state.students[current_index]['nota'] = new_grade
-                        st.session_state.modification_attempts[selected_name] = attempts + 1
-                        st.toast(f"Nota de '{selected_name}' actualizada.", icon="✅")
-                        st.info(f"Intentos restantes para '{selected_name}': {MODIFICATION_LIMIT - (attempts + 1)}")
+                        update_student_grade(current_index, new_grade)
+                        st.session_state.modification_attempts[student_id] = attempts + 1
+                        st.toast(
+                            f"Nota de '{selected_name}' actualizada. "
+                            + REMAINING_MSG[attempts],
+                            icon="✅"
+                        )
+                        # Rerun completo para que el reporte muestre la nueva nota
+                        st.rerun()
 
 # --- Pestaña 4: Administración (Eliminar) ---
-with tab_admin:
+@st.fragment
+def render_admin():
+    """
+    Dibuja la pestaña de administración. Como fragmento, elegir un
+    estudiante o marcar la confirmación solo re-ejecuta esta función.
+    """
     st.header("Administración del Sistema")
     
     st.subheader("Eliminar un Estudiante")
-    if not st.session_state.students:
+    if not st.session_state.names:
         st.info("No hay estudiantes ingresados para eliminar.")
     else:
-        delete_student_names = [student['nombre'] for student in st.session_state.students]
         delete_selected_name = st.selectbox(
             "Seleccione el estudiante a ELIMINAR:",
-            delete_student_names,
+            st.session_state.names,
             index=None,
             placeholder="Seleccionar estudiante..."
         )
@@ -309,12 +556,37 @@ with tab_admin:
             if st.button(f"Eliminar permanentemente a {delete_selected_name}", type="primary"):
                 if delete_student(delete_selected_name):
                     st.toast(f"¡Estudiante '{delete_selected_name}' eliminado!", icon="🗑️")
-                    st.rerun() # Recargamos para actualizar los selectores
+                    # Rerun completo: el reporte y la pestaña de modificar
+                    # también cambian (sus cálculos pesados están en caché)
+                    st.rerun()
                 else:
                     st.error("No se pudo eliminar al estudiante.")
 
     st.divider()
 
+    # Restaurar desde un CSV exportado (los datos solo viven en la sesión)
+    st.subheader("Restaurar desde CSV")
+    st.write("Cargue un reporte exportado para recuperar los estudiantes sin ingresarlos de nuevo.")
+    uploaded = st.file_uploader("Archivo CSV (columnas 'nombre' y 'nota')", type="csv")
+    if uploaded is not None and st.button("Importar estudiantes"):
+        try:
+            # Nombres como texto literal: "NA", "None" o "123" son nombres válidos
+            imported = pd.read_csv(uploaded, dtype={'nombre': str}, keep_default_na=False)
+        except (pd.errors.ParserError, pd.errors.EmptyDataError, UnicodeDecodeError):
+            imported = None
+        if imported is None or not {'nombre', 'nota'}.issubset(imported.columns):
+            st.error("El archivo no es un CSV válido con las columnas 'nombre' y 'nota'.")
+        else:
+            nota = pd.to_numeric(imported['nota'], errors='coerce')
+            added, skipped = add_students(zip(imported['nombre'], nota))
+            if added:
+                st.toast(with_skipped_summary(f"Importados {added} estudiantes.", skipped), icon="📥")
+                st.rerun()
+            else:
+                st.warning(with_skipped_summary("No se importó ningún estudiante.", skipped))
+
+    st.divider()
+
     # Zona de Peligro (Nueva Funcionalidad)
     st.subheader("⚠️ Zona de Peligro")
     st.write("Estas acciones no se pueden deshacer.")
@@ -325,3 +597,19 @@ with tab_admin:
             st.toast("Todos los datos han sido eliminados.", icon="🔥")
             st.rerun()
 
+
+# --- Navegación por Pestañas (En lugar del Sidebar) ---
+# Etiqueta de la pestaña -> función que dibuja su contenido
+TABS = {
+    "📊 Reporte General": render_report,
+    "➕ Ingresar Nota": render_add,
+    "✏️ Modificar Nota": render_modify,
+    "🗑️ Administración": render_admin,
+}
+TAB_LABELS = tuple(TABS)
+TAB_RENDERERS = tuple(TABS.values())
+
+for tab, render_tab in zip(st.tabs(TAB_LABELS), TAB_RENDERERS):
+    with tab:
+        render_tab()
+